@@ -0,0 +1,38 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Entrypoint of the ZenML CLI."""
+
+import sys
+
+
+def main() -> None:
+    """Run the ZenML CLI.
+
+    Version requests are answered directly, without importing the CLI
+    command modules and their dependencies.
+    """
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        from zenml import __version__
+
+        # Same output as the `click.version_option` of the root CLI group
+        print(f"zenml, version {__version__}")
+        return
+
+    from zenml.cli.cli import cli
+
+    cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -2524,5 +2524,4 @@ from zenml.cli.service_connectors import *  # noqa
 from zenml.cli.stack import *  # noqa
 from zenml.cli.stack_components import *  # noqa
 from zenml.cli.user_management import *  # noqa
-from zenml.cli.project import *  # noqa
 from zenml.cli.tag import *  # noqa
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Core CLI functionality."""
 
+import importlib
 import os
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
@@ -57,13 +58,89 @@ class TagGroup(click.Group):
         self.tag = tag or CliCategories.OTHER_COMMANDS
 
 
+class LazyGroup(click.Group):
+    """Click group that imports some of its subcommands only when needed.
+
+    Lazy subcommands are declared as a mapping from the command name to an
+    import path of the form `module.path:attribute`. The module is only
+    imported once the command is actually resolved, which keeps it (and all
+    of its dependencies) off the import path of unrelated commands.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the lazy group.
+
+        Args:
+            *args: Positional arguments passed to the click group.
+            lazy_subcommands: Mapping from command names to the import path
+                of the command object, e.g.
+                `{"project": "zenml.cli.project:project"}`.
+            **kwargs: Keyword arguments passed to the click group.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: Context) -> List[str]:
+        """List the names of all eager and lazy subcommands.
+
+        Args:
+            ctx: The click context.
+
+        Returns:
+            The sorted names of all subcommands.
+        """
+        base = super().list_commands(ctx)
+        return sorted(set(base) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: Context, cmd_name: str) -> Optional[Command]:
+        """Get a subcommand, importing it first if it is a lazy subcommand.
+
+        Args:
+            ctx: The click context.
+            cmd_name: The name of the subcommand.
+
+        Returns:
+            The subcommand or None if no subcommand with that name exists.
+        """
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name: str) -> Command:
+        """Import a lazy subcommand.
+
+        Args:
+            cmd_name: The name of the subcommand.
+
+        Returns:
+            The imported subcommand.
+
+        Raises:
+            ValueError: If the import path does not point to a click command.
+        """
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        module = importlib.import_module(module_name)
+        cmd_object = getattr(module, attribute)
+        if not isinstance(cmd_object, Command):
+            raise ValueError(
+                f"Lazy loading of `{self.lazy_subcommands[cmd_name]}` failed "
+                "because it is not a click command."
+            )
+        return cmd_object
+
+
 class ZenContext(click.Context):
     """Override the default click Context to add the new Formatter."""
 
     formatter_class = ZenFormatter
 
 
-class ZenMLCLI(click.Group):
+class ZenMLCLI(LazyGroup):
     """Custom click Group to create a custom format command help output."""
 
     context_class = ZenContext
@@ -144,7 +221,10 @@ class ZenMLCLI(click.Group):
                     formatter.write_dl(rows)  # type: ignore[arg-type]
 
 
-@click.group(cls=ZenMLCLI)
+@click.group(
+    cls=ZenMLCLI,
+    lazy_subcommands={"project": "zenml.cli.project:project"},
+)
 @click.version_option(__version__, "--version", "-v")
 def cli() -> None:
     """CLI base command for ZenML."""
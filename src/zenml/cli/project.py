@@ -25,7 +25,6 @@ from zenml.cli.utils import (
     list_options,
 )
 from zenml.client import Client
-from zenml.console import console
 from zenml.enums import CliCategories
 from zenml.models import ProjectFilter
 
@@ -47,7 +46,7 @@ def list_projects(ctx: click.Context, /, **kwargs: Any) -> None:
     """
     check_zenml_pro_project_availability()
     client = Client()
-    with console.status("Listing projects...\n"):
+    with cli_utils.status("Listing projects...\n"):
         projects = client.list_projects(**kwargs)
         if projects:
             try:
@@ -102,7 +101,7 @@ def register_project(
     """
     check_zenml_pro_project_availability()
     client = Client()
-    with console.status("Creating project...\n"):
+    with cli_utils.status("Creating project...\n"):
         try:
             project = client.create_project(
                 project_name,
@@ -144,7 +143,7 @@ def set_project(project_name_or_id: str, default: bool = False) -> None:
     """
     check_zenml_pro_project_availability()
     client = Client()
-    with console.status("Setting project...\n"):
+    with cli_utils.status("Setting project...\n"):
         try:
             project = client.set_active_project(project_name_or_id)
             cli_utils.declare(
@@ -199,7 +198,7 @@ def delete_project(project_name_or_id: str) -> None:
     """
     check_zenml_pro_project_availability()
     client = Client()
-    with console.status("Deleting project...\n"):
+    with cli_utils.status("Deleting project...\n"):
         try:
             client.delete_project(project_name_or_id)
             cli_utils.declare(
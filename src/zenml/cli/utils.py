@@ -186,6 +186,27 @@ def warning(
     console.print(text, style=style, **kwargs)
 
 
+@contextlib.contextmanager
+def status(text: str) -> Iterator[None]:
+    """Show a status spinner on the CLI while the context is active.
+
+    The spinner is only shown when the output goes to a terminal, otherwise
+    rich's live display machinery is skipped entirely.
+
+    Args:
+        text: The status message to display.
+
+    Yields:
+        None
+    """
+    if not console.is_terminal:
+        yield
+        return
+
+    with console.status(text):
+        yield
+
+
 def print_markdown(text: str) -> None:
     """Prints a string as markdown.
 
@@ -2270,8 +2291,17 @@ def print_pipeline_runs_table(
 
 def check_zenml_pro_project_availability() -> None:
     """Check if the ZenML Pro project feature is available."""
-    client = Client()
-    if not client.zen_store.get_store_info().is_pro_server():
+    from zenml.zen_stores.rest_zen_store import RestZenStore
+
+    zen_store = Client().zen_store
+    if isinstance(zen_store, RestZenStore):
+        # Reuse the server info the store already fetched when connecting
+        # instead of requesting it from the server again
+        store_info = zen_store.server_info
+    else:
+        store_info = zen_store.get_store_info()
+
+    if not store_info.is_pro_server():
         warning(
             "The ZenML projects feature is available only on ZenML Pro. "
             "Please visit https://zenml.io/pro to learn more."
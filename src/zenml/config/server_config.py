@@ -32,6 +32,7 @@ from zenml.constants import (
     DEFAULT_REPORTABLE_RESOURCES,
     DEFAULT_ZENML_JWT_TOKEN_ALGORITHM,
     DEFAULT_ZENML_JWT_TOKEN_LEEWAY,
+    DEFAULT_ZENML_SERVER_CONCURRENT_REQUESTS_PER_USER,
     DEFAULT_ZENML_SERVER_DEVICE_AUTH_POLLING,
     DEFAULT_ZENML_SERVER_DEVICE_AUTH_TIMEOUT,
     DEFAULT_ZENML_SERVER_GENERIC_API_TOKEN_LIFETIME,
@@ -156,6 +157,9 @@ class ServerConfiguration(BaseModel):
             server.
         login_rate_limit_minute: The number of login attempts allowed per minute.
         login_rate_limit_day: The number of login attempts allowed per day.
+        concurrent_requests_per_user: The number of requests a single user
+            is allowed to have in flight at the same time across all
+            endpoints of a resource that limit concurrent requests.
         secure_headers_server: Custom value to be set in the `Server` HTTP
             header to identify the server. If not specified, or if set to one of
             the reserved values `enabled`, `yes`, `true`, `on`, the `Server`
@@ -294,6 +298,9 @@ class ServerConfiguration(BaseModel):
     rate_limit_enabled: bool = False
     login_rate_limit_minute: int = DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_MINUTE
     login_rate_limit_day: int = DEFAULT_ZENML_SERVER_LOGIN_RATE_LIMIT_DAY
+    concurrent_requests_per_user: int = (
+        DEFAULT_ZENML_SERVER_CONCURRENT_REQUESTS_PER_USER
+    )
 
     secure_headers_server: Union[bool, str] = Field(
         default=True,
@@ -14,7 +14,9 @@
 """Rate limiting for the ZenML Server."""
 
 import inspect
+import threading
 import time
+import weakref
 from collections import defaultdict
 from contextlib import contextmanager
 from functools import wraps
@@ -198,3 +200,123 @@ def rate_limit_requests(
         return cast(F, decorated)
 
     return decorator
+
+
+class ConcurrencyLimiter:
+    """Simple in-memory limiter for concurrent requests per user."""
+
+    def __init__(self, max_in_flight: Optional[int] = None):
+        """Initializes the limiter.
+
+        Args:
+            max_in_flight: The number of requests a single user is allowed to
+                have in flight at the same time. Defaults to the server
+                configuration value.
+        """
+        self.limiting_enabled = server_config().rate_limit_enabled
+        if not self.limiting_enabled:
+            return
+        self.max_in_flight = (
+            max_in_flight or server_config().concurrent_requests_per_user
+        )
+        self._lock = threading.Lock()
+        # Semaphores are only kept alive by the requests currently holding
+        # them, so entries of idle users are dropped automatically.
+        self._semaphores: weakref.WeakValueDictionary[
+            str, threading.BoundedSemaphore
+        ] = weakref.WeakValueDictionary()
+
+    def _get_semaphore(self, key: str) -> threading.BoundedSemaphore:
+        """Get or create the semaphore for a user.
+
+        Args:
+            key: The key identifying the user.
+
+        Returns:
+            The semaphore of the user.
+        """
+        with self._lock:
+            semaphore = self._semaphores.get(key)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_in_flight)
+                self._semaphores[key] = semaphore
+            return semaphore
+
+    @contextmanager
+    def limit_concurrent_requests(
+        self, key: str
+    ) -> Generator[None, Any, Any]:
+        """Limits the number of concurrent requests of a user.
+
+        Args:
+            key: The key identifying the user.
+
+        Yields:
+            None
+
+        Raises:
+            HTTPException: If the user has too many requests in flight.
+        """
+        if not self.limiting_enabled:
+            yield
+            return
+
+        semaphore = self._get_semaphore(key)
+        # Never wait for a slot: the requests run on the server threadpool and
+        # a waiting request would hold a worker thread that other users need.
+        if not semaphore.acquire(blocking=False):
+            from fastapi import HTTPException
+
+            raise HTTPException(
+                status_code=429, detail="Too many concurrent requests."
+            )
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
+_concurrency_limiters: Dict[str, ConcurrencyLimiter] = {}
+
+
+def limit_concurrent_requests(
+    resource: str,
+    max_in_flight: Optional[int] = None,
+) -> Callable[[F], F]:
+    """Decorator to limit the number of concurrent requests per user.
+
+    All endpoints decorated with the same resource share a single limiter,
+    so the limit applies to the in-flight requests of a user across all of
+    them. The decorator has to be applied below `handle_exceptions` so that
+    the authentication context of the request is already set.
+
+    Args:
+        resource: The resource the limit applies to, e.g. the resource type
+            of the decorated endpoints.
+        max_in_flight: The number of requests a single user is allowed to have
+            in flight at the same time for the resource. Defaults to the
+            server configuration value. Only used by the first endpoint that
+            is decorated for a resource.
+
+    Returns:
+        Decorated function.
+    """
+    if resource not in _concurrency_limiters:
+        _concurrency_limiters[resource] = ConcurrencyLimiter(
+            max_in_flight=max_in_flight
+        )
+    limiter = _concurrency_limiters[resource]
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def decorated(*args: Any, **kwargs: Any) -> Any:
+            from zenml.zen_server.auth import get_auth_context
+
+            auth_context = get_auth_context()
+            key = str(auth_context.user.id) if auth_context else "anonymous"
+            with limiter.limit_concurrent_requests(key):
+                return func(*args, **kwargs)
+
+        return cast(F, decorated)
+
+    return decorator
@@ -110,7 +110,7 @@ def dehydrate_response_model(
     if not server_config().rbac_enabled:
         return model
 
-    if not permissions:
+    if permissions is None:
         auth_context = get_auth_context()
         assert auth_context
 
@@ -153,10 +153,20 @@ def _dehydrate_value(
         if not resource:
             return dehydrate_response_model(value, permissions=permissions)
 
-        has_permissions = (permissions or {}).get(resource, False)
-        if has_permissions or has_permissions_for_model(
-            model=permission_model, action=Action.READ
-        ):
+        if permissions is not None and resource in permissions:
+            # Use the prefetched result instead of asking the RBAC component
+            # again for every single sub-model
+            has_permissions = permissions[resource]
+            if not has_permissions:
+                has_permissions = is_owned_by_authenticated_user(
+                    permission_model
+                )
+        else:
+            has_permissions = has_permissions_for_model(
+                model=permission_model, action=Action.READ
+            )
+
+        if has_permissions:
             return dehydrate_response_model(value, permissions=permissions)
         else:
             return get_permission_denied_model(value)
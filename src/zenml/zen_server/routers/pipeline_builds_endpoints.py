@@ -27,6 +27,7 @@ from zenml.models import (
 )
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
+from zenml.zen_server.rate_limit import limit_concurrent_requests
 from zenml.zen_server.rbac.endpoint_utils import (
     verify_permissions_and_create_entity,
     verify_permissions_and_delete_entity,
@@ -36,10 +37,11 @@ from zenml.zen_server.rbac.endpoint_utils import (
 from zenml.zen_server.rbac.models import ResourceType
 from zenml.zen_server.routers.projects_endpoints import workspace_router
 from zenml.zen_server.utils import (
+    get_zen_store,
     handle_exceptions,
     make_dependable,
-    zen_store,
 )
+from zenml.zen_stores.sql_zen_store import SqlZenStore
 
 router = APIRouter(
     prefix=API + VERSION_1 + PIPELINE_BUILDS,
@@ -47,23 +49,39 @@ router = APIRouter(
     responses={401: error_response, 403: error_response},
 )
 
+# Shared between the regular and the workspace scoped routes below.
+_CREATE_RESPONSES = {
+    401: error_response,
+    409: error_response,
+    422: error_response,
+    429: error_response,
+}
+_ENTITY_RESPONSES = {
+    401: error_response,
+    404: error_response,
+    422: error_response,
+    429: error_response,
+}
+
 
 @router.post(
     "",
-    responses={401: error_response, 409: error_response, 422: error_response},
+    responses=_CREATE_RESPONSES,
 )
 # TODO: the workspace scoped endpoint is only kept for dashboard compatibility
 # and can be removed after the migration
 @workspace_router.post(
     "/{project_name_or_id}" + PIPELINE_BUILDS,
-    responses={401: error_response, 409: error_response, 422: error_response},
+    responses=_CREATE_RESPONSES,
     deprecated=True,
     tags=["builds"],
 )
 @handle_exceptions
+@limit_concurrent_requests(resource=ResourceType.PIPELINE_BUILD)
 def create_build(
     build: PipelineBuildRequest,
     project_name_or_id: Optional[Union[str, UUID]] = None,
+    store: SqlZenStore = Depends(get_zen_store),
     _: AuthContext = Security(authorize),
 ) -> PipelineBuildResponse:
     """Creates a build, optionally in a specific project.
@@ -71,39 +89,41 @@ def create_build(
     Args:
         build: Build to create.
         project_name_or_id: Optional name or ID of the project.
+        store: The ZenML Store.
 
     Returns:
         The created build.
     """
     if project_name_or_id:
-        project = zen_store().get_project(project_name_or_id)
-        build.project = project.id
+        build.project = store.get_project_id(project_name_or_id)
 
     return verify_permissions_and_create_entity(
         request_model=build,
-        create_method=zen_store().create_build,
+        create_method=store.create_build,
     )
 
 
 @router.get(
     "",
-    responses={401: error_response, 404: error_response, 422: error_response},
+    responses=_ENTITY_RESPONSES,
 )
 # TODO: the workspace scoped endpoint is only kept for dashboard compatibility
 # and can be removed after the migration
 @workspace_router.get(
     "/{project_name_or_id}" + PIPELINE_BUILDS,
-    responses={401: error_response, 404: error_response, 422: error_response},
+    responses=_ENTITY_RESPONSES,
     deprecated=True,
     tags=["builds"],
 )
 @handle_exceptions
+@limit_concurrent_requests(resource=ResourceType.PIPELINE_BUILD)
 def list_builds(
     build_filter_model: PipelineBuildFilter = Depends(
         make_dependable(PipelineBuildFilter)
     ),
     project_name_or_id: Optional[Union[str, UUID]] = None,
     hydrate: bool = False,
+    store: SqlZenStore = Depends(get_zen_store),
     _: AuthContext = Security(authorize),
 ) -> Page[PipelineBuildResponse]:
     """Gets a list of builds.
@@ -114,6 +134,7 @@ def list_builds(
         project_name_or_id: Optional name or ID of the project to filter by.
         hydrate: Flag deciding whether to hydrate the output model(s)
             by including metadata fields in the response.
+        store: The ZenML Store.
 
     Returns:
         List of build objects matching the filter criteria.
@@ -124,19 +145,21 @@ def list_builds(
     return verify_permissions_and_list_entities(
         filter_model=build_filter_model,
         resource_type=ResourceType.PIPELINE_BUILD,
-        list_method=zen_store().list_builds,
+        list_method=store.list_builds,
         hydrate=hydrate,
     )
 
 
 @router.get(
     "/{build_id}",
-    responses={401: error_response, 404: error_response, 422: error_response},
+    responses=_ENTITY_RESPONSES,
 )
 @handle_exceptions
+@limit_concurrent_requests(resource=ResourceType.PIPELINE_BUILD)
 def get_build(
     build_id: UUID,
     hydrate: bool = True,
+    store: SqlZenStore = Depends(get_zen_store),
     _: AuthContext = Security(authorize),
 ) -> PipelineBuildResponse:
     """Gets a specific build using its unique id.
@@ -145,31 +168,35 @@ def get_build(
         build_id: ID of the build to get.
         hydrate: Flag deciding whether to hydrate the output model(s)
             by including metadata fields in the response.
+        store: The ZenML Store.
 
     Returns:
         A specific build object.
     """
     return verify_permissions_and_get_entity(
-        id=build_id, get_method=zen_store().get_build, hydrate=hydrate
+        id=build_id, get_method=store.get_build, hydrate=hydrate
     )
 
 
 @router.delete(
     "/{build_id}",
-    responses={401: error_response, 404: error_response, 422: error_response},
+    responses=_ENTITY_RESPONSES,
 )
 @handle_exceptions
+@limit_concurrent_requests(resource=ResourceType.PIPELINE_BUILD)
 def delete_build(
     build_id: UUID,
+    store: SqlZenStore = Depends(get_zen_store),
     _: AuthContext = Security(authorize),
 ) -> None:
     """Deletes a specific build.
 
     Args:
         build_id: ID of the build to delete.
+        store: The ZenML Store.
     """
     verify_permissions_and_delete_entity(
         id=build_id,
-        get_method=zen_store().get_build,
-        delete_method=zen_store().delete_build,
+        get_method=store.get_build,
+        delete_method=store.delete_build,
     )
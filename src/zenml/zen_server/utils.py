@@ -86,6 +86,19 @@ def zen_store() -> "SqlZenStore":
     return _zen_store
 
 
+async def get_zen_store() -> "SqlZenStore":
+    """FastAPI dependency that resolves the ZenML Store once per request.
+
+    This is defined as a coroutine so that FastAPI resolves it directly on the
+    event loop instead of dispatching it to the threadpool like it does for
+    synchronous dependencies.
+
+    Returns:
+        The ZenML Store.
+    """
+    return zen_store()
+
+
 def plugin_flavor_registry() -> PluginFlavorRegistry:
     """Get the plugin flavor registry.
 
@@ -278,15 +291,16 @@ def handle_exceptions(func: F) -> F:
         Decorated function.
     """
 
-    @wraps(func)
-    def decorated(*args: Any, **kwargs: Any) -> Any:
-        # These imports can't happen at module level as this module is also
-        # used by the CLI when installed without the `server` extra
-        from fastapi import HTTPException
-        from fastapi.responses import JSONResponse
+    # These imports can't happen at module level as this module is also
+    # used by the CLI when installed without the `server` extra. They are
+    # done once when decorating instead of on every request.
+    from fastapi import HTTPException
+    from fastapi.responses import JSONResponse
 
-        from zenml.zen_server.auth import AuthContext, set_auth_context
+    from zenml.zen_server.auth import AuthContext, set_auth_context
 
+    @wraps(func)
+    def decorated(*args: Any, **kwargs: Any) -> Any:
         for arg in args:
             if isinstance(arg, AuthContext):
                 set_auth_context(arg)
@@ -9356,6 +9356,40 @@ class SqlZenStore(BaseZenStore):
             include_metadata=hydrate, include_resources=True
         )
 
+    def get_project_id(self, project_name_or_id: Union[str, UUID]) -> UUID:
+        """Get the ID of an existing project by name or ID.
+
+        Only the ID column is queried, which makes this cheaper than
+        `get_project` when the caller only needs to resolve or validate a
+        project reference.
+
+        Args:
+            project_name_or_id: Name or ID of the project.
+
+        Returns:
+            The ID of the project.
+
+        Raises:
+            KeyError: If no project with the given name or ID exists.
+        """
+        if uuid_utils.is_valid_uuid(project_name_or_id):
+            filter_params = ProjectSchema.id == project_name_or_id
+        else:
+            filter_params = ProjectSchema.name == project_name_or_id
+
+        with Session(self.engine) as session:
+            project_id = session.exec(
+                select(ProjectSchema.id).where(filter_params)
+            ).first()
+
+        if project_id is None:
+            raise KeyError(
+                f"Unable to get project with name or ID "
+                f"'{project_name_or_id}': No project with this name or ID "
+                "found."
+            )
+        return project_id
+
     def list_projects(
         self,
         project_filter_model: ProjectFilter,
@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 
 import os
+import subprocess
+import sys
 
 import click
 import pytest
@@ -39,6 +41,30 @@ def test_cli(runner):
     assert result.exit_code == 0
 
 
+def test_cli_resolves_lazy_subcommands():
+    """Check that lazy subcommands are listed and loaded on demand."""
+    context = click.Context(cli)
+    assert "project" in cli.list_commands(context)
+
+    project_group = cli.get_command(context, "project")
+    assert isinstance(project_group, click.Group)
+    assert "list" in project_group.list_commands(context)
+
+
+def test_cli_imports_lazy_subcommands_on_demand():
+    """Check that lazy subcommand modules are only imported when resolved."""
+    # Run in a fresh interpreter, other tests may have loaded the module
+    script = (
+        "import sys, click\n"
+        "from zenml.cli.cli import cli\n"
+        "assert 'zenml.cli.project' not in sys.modules\n"
+        "assert 'project' not in cli.commands\n"
+        "cli.get_command(click.Context(cli), 'project')\n"
+        "assert 'zenml.cli.project' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
 def test_ZenMLCLI_formatter():
     """
     Test the ZenFormatter class.
@@ -12,9 +12,12 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import sys
+
 from click.testing import CliRunner
 
 from zenml import __version__ as current_zenml_version
+from zenml.__main__ import main
 from zenml.cli.version import version
 
 
@@ -24,3 +27,12 @@ def test_version_outputs_running_version_number() -> None:
     result = runner.invoke(version)
     assert result.exit_code == 0
     assert current_zenml_version in result.output
+
+
+def test_version_flag_is_answered_by_the_entrypoint(mocker, capsys) -> None:
+    """Checks that the entrypoint answers `--version` without the CLI."""
+    mocker.patch.object(sys, "argv", ["zenml", "--version"])
+    main()
+    assert capsys.readouterr().out == (
+        f"zenml, version {current_zenml_version}\n"
+    )
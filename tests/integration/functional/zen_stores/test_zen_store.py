@@ -380,6 +380,26 @@ def test_deleting_default_project_fails():
         client.zen_store.delete_project(DEFAULT_NAME)
 
 
+def test_get_project_id():
+    """Tests resolving project names and IDs to project IDs."""
+    store = Client().zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Test only applies to SQL store")
+
+    default_project = store.get_project(DEFAULT_PROJECT_NAME)
+    assert store.get_project_id(DEFAULT_PROJECT_NAME) == default_project.id
+    assert store.get_project_id(default_project.id) == default_project.id
+    assert (
+        store.get_project_id(str(default_project.id)) == default_project.id
+    )
+
+    with pytest.raises(KeyError):
+        store.get_project_id(uuid4())
+
+    with pytest.raises(KeyError):
+        store.get_project_id(sample_name("nonexistent_project"))
+
+
 #  .------.
 # | USERS |
 # '-------'
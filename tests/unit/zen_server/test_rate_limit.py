@@ -0,0 +1,130 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from zenml.zen_server.rate_limit import (
+    ConcurrencyLimiter,
+    limit_concurrent_requests,
+)
+
+
+@pytest.fixture
+def enable_rate_limit(mocker):
+    """Enables rate limiting in the server configuration."""
+    config = mocker.patch("zenml.zen_server.rate_limit.server_config")
+    config.return_value.rate_limit_enabled = True
+
+
+def test_concurrency_limiter_rejects_requests_over_the_limit(
+    enable_rate_limit,
+):
+    """Tests that requests over the limit are rejected immediately."""
+    limiter = ConcurrencyLimiter(max_in_flight=1)
+
+    with limiter.limit_concurrent_requests("user"):
+        with pytest.raises(HTTPException) as exc_info:
+            with limiter.limit_concurrent_requests("user"):
+                pass
+
+        assert exc_info.value.status_code == 429
+
+        # Other users have their own slots
+        with limiter.limit_concurrent_requests("other_user"):
+            pass
+
+
+def test_concurrency_limiter_frees_slot_after_request(enable_rate_limit):
+    """Tests that a slot is released once the request finishes."""
+    limiter = ConcurrencyLimiter(max_in_flight=1)
+
+    with limiter.limit_concurrent_requests("user"):
+        pass
+
+    with limiter.limit_concurrent_requests("user"):
+        pass
+
+    with pytest.raises(RuntimeError):
+        with limiter.limit_concurrent_requests("user"):
+            raise RuntimeError
+
+    with limiter.limit_concurrent_requests("user"):
+        pass
+
+
+def test_concurrency_limiter_does_nothing_when_disabled(mocker):
+    """Tests that the limiter does not limit anything when disabled."""
+    config = mocker.patch("zenml.zen_server.rate_limit.server_config")
+    config.return_value.rate_limit_enabled = False
+    limiter = ConcurrencyLimiter(max_in_flight=1)
+
+    with limiter.limit_concurrent_requests("user"):
+        with limiter.limit_concurrent_requests("user"):
+            pass
+
+
+def test_concurrency_limit_is_shared_by_endpoints_of_a_resource(
+    enable_rate_limit, mocker
+):
+    """Tests that endpoints of the same resource share the user's slots."""
+    auth_context = mocker.patch("zenml.zen_server.auth.get_auth_context")
+    auth_context.return_value.user.id = uuid4()
+    resource = f"resource_{uuid4()}"
+
+    @limit_concurrent_requests(resource=resource, max_in_flight=1)
+    def first_endpoint() -> None:
+        second_endpoint()
+
+    @limit_concurrent_requests(resource=resource)
+    def second_endpoint() -> None:
+        pass
+
+    @limit_concurrent_requests(resource=f"other_{resource}", max_in_flight=1)
+    def other_resource_endpoint() -> None:
+        pass
+
+    with pytest.raises(HTTPException) as exc_info:
+        first_endpoint()
+    assert exc_info.value.status_code == 429
+
+    # The slot is free again and other resources have their own limit
+    second_endpoint()
+
+    @limit_concurrent_requests(resource=resource)
+    def calls_other_resource() -> None:
+        other_resource_endpoint()
+
+    calls_other_resource()
+
+
+def test_concurrency_limit_is_per_user(enable_rate_limit, mocker):
+    """Tests that the requests of different users are limited separately."""
+    auth_context = mocker.patch("zenml.zen_server.auth.get_auth_context")
+    auth_context.return_value.user.id = uuid4()
+    resource = f"resource_{uuid4()}"
+
+    @limit_concurrent_requests(resource=resource, max_in_flight=1)
+    def outer_endpoint() -> None:
+        # Another user calls an endpoint of the same resource meanwhile
+        auth_context.return_value.user.id = uuid4()
+        inner_endpoint()
+
+    @limit_concurrent_requests(resource=resource)
+    def inner_endpoint() -> None:
+        pass
+
+    outer_endpoint()
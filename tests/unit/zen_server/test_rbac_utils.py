@@ -0,0 +1,120 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from typing import List, Optional
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from zenml.models.v2.base.base import (
+    BaseDatedResponseBody,
+    BaseIdentifiedResponse,
+    BaseResponseMetadata,
+    BaseResponseResources,
+)
+from zenml.zen_server.rbac.models import Resource, ResourceType
+from zenml.zen_server.rbac.utils import (
+    dehydrate_response_model,
+    dehydrate_response_model_batch,
+)
+
+
+class SubModel(
+    BaseIdentifiedResponse[
+        BaseDatedResponseBody, BaseResponseMetadata, BaseResponseResources
+    ]
+):
+    """Sub-model which requires RBAC read permissions."""
+
+    owned: bool = False
+
+
+class ParentModel(BaseModel):
+    """Model referencing a sub-model."""
+
+    sub_model: SubModel
+
+
+def _get_resource(model: BaseModel) -> Optional[Resource]:
+    """Returns the RBAC resource of sub-models."""
+    if isinstance(model, SubModel):
+        return Resource(type=ResourceType.STACK, id=model.id)
+    return None
+
+
+@pytest.fixture
+def rbac_mock(mocker):
+    """Enables RBAC and mocks the RBAC component.
+
+    Sub-models are owned by the user if their `owned` attribute is set.
+    """
+    config = mocker.patch("zenml.zen_server.rbac.utils.server_config")
+    config.return_value.rbac_enabled = True
+    mocker.patch("zenml.zen_server.rbac.utils.get_auth_context")
+    mocker.patch(
+        "zenml.zen_server.rbac.utils.get_resource_for_model",
+        side_effect=_get_resource,
+    )
+    mocker.patch(
+        "zenml.zen_server.rbac.utils.is_owned_by_authenticated_user",
+        side_effect=lambda model: getattr(model, "owned", False),
+    )
+    rbac = mocker.patch("zenml.zen_server.rbac.utils.rbac")
+    return rbac.return_value
+
+
+def _denied_permissions(models: List[SubModel]) -> dict:
+    """Returns prefetched permissions denying access to the models."""
+    return {_get_resource(model): False for model in models}
+
+
+def test_prefetched_denial_is_overridden_by_ownership(rbac_mock):
+    """Tests that owned sub-models are included despite a prefetched denial."""
+    sub_model = SubModel(id=uuid4(), owned=True)
+
+    dehydrated = dehydrate_response_model(
+        ParentModel(sub_model=sub_model),
+        permissions=_denied_permissions([sub_model]),
+    )
+
+    assert dehydrated.sub_model.permission_denied is False
+    rbac_mock.check_permissions.assert_not_called()
+
+
+def test_prefetched_denial_is_used_without_rbac_call(rbac_mock):
+    """Tests that a prefetched denial is not checked again with RBAC."""
+    sub_model = SubModel(id=uuid4())
+
+    dehydrated = dehydrate_response_model(
+        ParentModel(sub_model=sub_model),
+        permissions=_denied_permissions([sub_model]),
+    )
+
+    assert dehydrated.sub_model.permission_denied is True
+    rbac_mock.check_permissions.assert_not_called()
+
+
+def test_empty_prefetched_permissions_do_not_trigger_refetch(rbac_mock):
+    """Tests that an empty batch prefetch is not repeated for every item."""
+    rbac_mock.check_permissions.return_value = {}
+    batch = [
+        ParentModel(sub_model=SubModel(id=uuid4(), owned=True))
+        for _ in range(3)
+    ]
+
+    dehydrated = dehydrate_response_model_batch(batch)
+
+    assert all(not item.sub_model.permission_denied for item in dehydrated)
+    assert rbac_mock.check_permissions.call_count == 1